@@ -1,7 +1,5 @@
 """Тесты для stats.py."""
 
-import tempfile
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -11,12 +9,9 @@ from whoop_telegram_bot_ai.storage import Storage
 
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_path):
     """Создание временной БД для тестов."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-    yield db_path
-    Path(db_path).unlink(missing_ok=True)
+    return str(tmp_path / "test.db")
 
 
 @pytest.fixture
@@ -1,20 +1,14 @@
 """Тесты для storage.py."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from whoop_telegram_bot_ai.storage import Storage
 
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_path):
     """Создание временной БД для тестов."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = f.name
-    yield db_path
-    Path(db_path).unlink(missing_ok=True)
+    return str(tmp_path / "test.db")
 
 
 @pytest.fixture
@@ -23,6 +17,12 @@ def storage(temp_db):
     return Storage(db_path=temp_db)
 
 
+@pytest.fixture(scope="module")
+def ro_storage(tmp_path_factory):
+    """Общий экземпляр Storage для тестов, не изменяющих БД."""
+    return Storage(db_path=str(tmp_path_factory.mktemp("ro") / "test.db"))
+
+
 def test_save_response(storage):
     """Тест сохранения ответа."""
     storage.save_response("S1", "success")
@@ -66,62 +66,68 @@ def test_get_ideal_days_count(storage):
     # Используем прямые SQL запросы для установки даты
     import sqlite3
 
+    rows = [
+        (yesterday, slot_id, "success", "2024-01-01T12:00:00")
+        for slot_id in ["S1", "S2", "S3", "S4", "S5"]
+    ]
+    # S6 с идеальным ответом
+    rows.append((yesterday, "S6", "ideal", "2024-01-01T21:00:00"))
+
     with sqlite3.connect(storage.db_path) as conn:
-        cursor = conn.cursor()
-        for slot_id in ["S1", "S2", "S3", "S4", "S5"]:
-            cursor.execute(
-                """
-                INSERT INTO slot_responses (date, slot_id, button_choice, timestamp)
-                VALUES (?, ?, ?, ?)
-                """,
-                (yesterday, slot_id, "success", "2024-01-01T12:00:00"),
-            )
-        # S6 с идеальным ответом
-        cursor.execute(
+        conn.executemany(
             """
             INSERT INTO slot_responses (date, slot_id, button_choice, timestamp)
             VALUES (?, ?, ?, ?)
             """,
-            (yesterday, "S6", "ideal", "2024-01-01T21:00:00"),
+            rows,
         )
-        conn.commit()
 
     ideal_count = storage.get_ideal_days_count(days=7)
     assert ideal_count >= 1
 
 
-def test_is_ideal_day_logic(storage):
+@pytest.mark.parametrize(
+    "responses, expected",
+    [
+        # 4 успешных из 5 и идеальный S6
+        (
+            {
+                "S1": "success",
+                "S2": "success",
+                "S3": "success",
+                "S4": "success",
+                "S5": "skip",  # Один пропущен
+                "S6": "ideal",
+            },
+            True,
+        ),
+        # Менее 4 успешных
+        (
+            {
+                "S1": "success",
+                "S2": "success",
+                "S3": "skip",
+                "S4": "skip",
+                "S5": "skip",
+                "S6": "ideal",
+            },
+            False,
+        ),
+        # Без идеального S6
+        (
+            {
+                "S1": "success",
+                "S2": "success",
+                "S3": "success",
+                "S4": "success",
+                "S5": "success",
+                "S6": "normal",  # Не идеальный
+            },
+            False,
+        ),
+    ],
+    ids=["ideal", "too_few_successful", "s6_not_ideal"],
+)
+def test_is_ideal_day_logic(ro_storage, responses, expected):
     """Тест логики определения эталонного дня."""
-    # Тест с 4 успешными из 5 и идеальным S6
-    responses = {
-        "S1": "success",
-        "S2": "success",
-        "S3": "success",
-        "S4": "success",
-        "S5": "skip",  # Один пропущен
-        "S6": "ideal",
-    }
-    assert storage._is_ideal_day(responses) is True
-
-    # Тест с менее чем 4 успешными
-    responses_bad = {
-        "S1": "success",
-        "S2": "success",
-        "S3": "skip",
-        "S4": "skip",
-        "S5": "skip",
-        "S6": "ideal",
-    }
-    assert storage._is_ideal_day(responses_bad) is False
-
-    # Тест без идеального S6
-    responses_no_s6 = {
-        "S1": "success",
-        "S2": "success",
-        "S3": "success",
-        "S4": "success",
-        "S5": "success",
-        "S6": "normal",  # Не идеальный
-    }
-    assert storage._is_ideal_day(responses_no_s6) is False
-
+    assert ro_storage._is_ideal_day(responses) is expected